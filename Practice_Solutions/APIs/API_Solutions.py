@@ -1,53 +1,134 @@
+import asyncio
+import functools
+from operator import itemgetter
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
 
+# ==========================================
+# SHARED SESSION (Connection Pooling)
+# ==========================================
+# A Session reuses TCP connections (HTTP keep-alive), so repeated calls to the
+# same host skip the DNS lookup + TCP/TLS handshake that plain requests.get()
+# pays on every call. The mounted adapter also retries transient failures
+# without re-handshaking.
+# Note: the session is NOT fork-safe - create a fresh one per process.
+_SESSION = None
+
+def _get_session():
+    """Return the shared Session, creating it on first use (lazy singleton)."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                # Retry gateway errors too - without a status_forcelist the
+                # adapter only retries connection-level failures and hands a
+                # transient 502/503 back as a normal response.
+                status_forcelist=(500, 502, 503, 504),
+            )
+        )
+        _SESSION.mount("https://", adapter)
+    return _SESSION
+
 # ==========================================
 # TASK 8.1: Basic Fetch (Dog API)
 # ==========================================
 def fetch_random_dog():
     url = "https://dog.ceo/api/breeds/image/random"
-    response = requests.get(url)
+    response = _get_session().get(url, timeout=5)
     if response.status_code == 200:
         data = response.json()
         print(f"Dog Image: {data['message']}")
     else:
         print("Failed to fetch dog.")
 
+# Hoisted constants: built once at import instead of on every call.
+_POKE_BASE = "https://pokeapi.co/api/v2/pokemon/"
+_SPOTIFY_TOKEN_URL = "https://accounts.spotify.com/api/token"
+_SPOTIFY_BODY = {"grant_type": "client_credentials"}  # static - requests copies it
+
+# Built once: extracts the fields we care about from a PokeAPI response
+# in a single C-level dispatch.
+_POKE_FIELDS = itemgetter('name', 'id', 'stats', 'types')
+
 # ==========================================
 # TASK 8.2: PokeAPI Wrapper
 # ==========================================
 def get_pokemon_data(name):
-    url = f"https://pokeapi.co/api/v2/pokemon/{name.lower()}"
-    response = requests.get(url)
-    
-    if response.status_code == 200:
-        data = response.json()
-        return {
-            "name": data['name'],
-            "id": data['id'],
-            "hp": data['stats'][0]['base_stat'], # HP is usually first
-            "type": data['types'][0]['type']['name']
-        }
-    return None
+    # Normalize before hitting the cache so "Pikachu" and "pikachu"
+    # share one entry.
+    try:
+        return _get_pokemon_data_cached(name.lower())
+    except requests.RequestException:
+        return None
+
+@functools.lru_cache(maxsize=1024)
+def _get_pokemon_data_cached(name):
+    # PokeAPI data for a given name is effectively immutable, so repeat
+    # lookups can be served from memory instead of re-hitting the network.
+    # Note: the cache hands back the SAME dict each time - treat it as
+    # read-only, or copy it before mutating.
+    url = _POKE_BASE + name
+    response = _get_session().get(url, timeout=5)
+
+    # Raise on failure instead of returning None: lru_cache only stores
+    # results of calls that RETURN, so a failed lookup is retried on the
+    # next call rather than cached as a permanent miss for this name.
+    response.raise_for_status()
+
+    data = response.json()
+    # One C-level itemgetter call pulls all four top-level fields,
+    # instead of four separate data[...] subscriptions.
+    poke_name, poke_id, stats, types = _POKE_FIELDS(data)
+    return {
+        "name": poke_name,
+        "id": poke_id,
+        "hp": stats[0]['base_stat'], # HP is usually first
+        "type": types[0]['type']['name']
+    }
+
+# ==========================================
+# TASK 8.2b: Batch Lookups (Concurrent)
+# ==========================================
+async def get_pokemon_data_many(names):
+    """
+    Fetch many Pokemon concurrently instead of one at a time.
+
+    Calling get_pokemon_data in a loop pays one full round-trip per name.
+    Fanning the calls out with asyncio.gather overlaps the waiting, so the
+    wall-clock time for N names is roughly ONE round-trip instead of N.
+    The blocking session calls run in worker threads via asyncio.to_thread,
+    and the shared pooled session keeps the sockets warm across them.
+
+    Usage:
+        results = asyncio.run(get_pokemon_data_many(["pikachu", "ditto"]))
+    """
+    return await asyncio.gather(
+        *(asyncio.to_thread(get_pokemon_data, name) for name in names)
+    )
 
 # ==========================================
 # TASK 8.3: Spotify Auth (Conceptual)
 # ==========================================
-def get_spotify_token(client_id, client_secret):
-    url = "https://accounts.spotify.com/api/token"
-    
-    # Encode credentials
+@functools.lru_cache(maxsize=8)
+def _basic_auth_header(client_id, client_secret):
+    # Same credentials -> same header; cache it so repeat token requests
+    # skip the base64 work and dict construction.
     creds = f"{client_id}:{client_secret}"
     b64_creds = base64.b64encode(creds.encode()).decode()
-    
-    headers = {
-        "Authorization": f"Basic {b64_creds}"
-    }
-    data = {
-        "grant_type": "client_credentials"
-    }
-    
-    response = requests.post(url, headers=headers, data=data)
+    return {"Authorization": f"Basic {b64_creds}"}
+
+def get_spotify_token(client_id, client_secret):
+    headers = _basic_auth_header(client_id, client_secret)
+    response = _get_session().post(
+        _SPOTIFY_TOKEN_URL, headers=headers, data=_SPOTIFY_BODY, timeout=5
+    )
     
     if response.status_code == 200:
         return response.json().get("access_token")
@@ -1,5 +1,7 @@
 import asyncio
 import random
+import time
+from array import array
 
 # ==========================================
 # TASK 13.1: Custom Generator
@@ -16,6 +18,29 @@ def fibonacci_generator(limit):
         a, b = b, a + b
         count += 1
 
+def fibonacci_array(limit):
+    """
+    Bulk version of fibonacci_generator for consumers that want all
+    values at once.
+
+    The generator is great for streaming, but resuming a generator frame
+    per value has real overhead when the caller immediately collects
+    everything. This preallocates a C-backed array('Q') buffer and fills
+    it in one tight loop, so bulk consumers iterate contiguous machine
+    ints instead of boxed Python objects.
+
+    'Q' is an unsigned 64-bit slot, which holds Fibonacci numbers up to
+    fib(93) - hence the limit guard.
+    """
+    if limit > 94:
+        raise ValueError("fibonacci_array supports limit <= 94 (uint64 overflow)")
+    out = array('Q', bytes(8 * limit))  # preallocated, zero-filled
+    a, b = 0, 1
+    for i in range(limit):
+        out[i] = a
+        a, b = b, a + b
+    return out
+
 def test_generator():
     print("--- Fibonacci Generator (First 10) ---")
     for num in fibonacci_generator(10):
@@ -28,28 +53,45 @@ def test_generator():
 async def fetch_data_mock(id, delay):
     """Simulates fetching data from an API with a delay."""
     print(f"Task {id}: Fetching data...")
+    # IMPORTANT: inside 'async def', always await asyncio.sleep().
+    # A plain time.sleep() here would block the whole event loop and turn
+    # N concurrent tasks back into N sequential ones.
     await asyncio.sleep(delay) # Non-blocking sleep
     print(f"Task {id}: Done! (took {delay}s)")
     return f"Data_{id}"
 
+async def _abackoff(attempt):
+    """
+    Async-safe exponential backoff: sleep 0.1s * 2^attempt, capped at 5s.
+
+    Use this (never time.sleep) when adding retries to a real async HTTP
+    version of fetch_data_mock - blocking sleeps in coroutines serialize
+    every other task on the loop for the full sleep duration.
+    """
+    await asyncio.sleep(min(2 ** attempt * 0.1, 5))
+
 async def main_async_flow():
     print("--- Starting Async Tasks ---")
     start = time.perf_counter()
-    
-    # Schedule 3 calls to run concurrently
-    results = await asyncio.gather(
-        fetch_data_mock(1, 2), # 2 seconds
-        fetch_data_mock(2, 1), # 1 second
-        fetch_data_mock(3, 3)  # 3 seconds
-    )
-    
+
+    # Schedule 3 calls to run concurrently using TaskGroup (Python 3.11+).
+    # Compared to asyncio.gather, TaskGroup is structured concurrency:
+    # if one task fails, the others are cancelled instead of running on,
+    # and tasks are scheduled without gather's per-call future wrapping.
+    async with asyncio.TaskGroup() as tg:
+        t1 = tg.create_task(fetch_data_mock(1, 2)) # 2 seconds
+        t2 = tg.create_task(fetch_data_mock(2, 1)) # 1 second
+        t3 = tg.create_task(fetch_data_mock(3, 3)) # 3 seconds
+
+    # All tasks are guaranteed finished once the 'async with' block exits
+    results = [t1.result(), t2.result(), t3.result()]
+
     end = time.perf_counter()
     print(f"All tasks completed in {end - start:.2f} seconds.")
     print(f"Results: {results}")
 
 if __name__ == "__main__":
     test_generator()
-    
+
     # Run Async Loop
-    import time
     asyncio.run(main_async_flow())
@@ -16,7 +16,10 @@ These are Python's most commonly used built-in data structures. Understanding
 when to use each one is crucial for writing efficient, readable code.
 """
 
-from typing import Dict, List, Optional, Set
+import sys
+from array import array
+from operator import mul
+from typing import Dict, List, NamedTuple, Optional, Set
 
 
 # ==========================================
@@ -115,47 +118,84 @@ def celcius_to_farenheit(c: float) -> float:
 # ==========================================
 # TASK 3.3: List Statistics
 # ==========================================
-def list_statistics(numbers: List[float]) -> Optional[Dict[str, float]]:
+def _min_max_sum(numbers: List[float]) -> tuple:
+    """
+    Compute min, max, and sum in a single pass over the data.
+
+    Calling min(), max(), and sum() separately walks the list three times.
+    Fusing the three reductions into one loop ("loop fusion") moves each
+    element through the CPU once - the win that matters when the data no
+    longer fits in cache.
+
+    Args:
+        numbers: Non-empty list of numeric values
+
+    Returns:
+        Tuple of (min, max, sum)
+    """
+    mn = mx = numbers[0]
+    total = 0.0
+    for v in numbers:
+        total += v
+        if v < mn:
+            mn = v
+        elif v > mx:
+            mx = v
+    return mn, mx, total
+
+
+class Stats(NamedTuple):
+    """
+    Fixed-layout result type for list_statistics.
+
+    Compared with a dict, a NamedTuple has no per-instance hash table:
+    attribute access (s.avg) is a direct slot load instead of a hash+probe,
+    and each instance is smaller. It still unpacks positionally:
+    mx, mn, avg, total = list_statistics(xs)
+    """
+    max: float
+    min: float
+    avg: float
+    sum: float
+
+
+def list_statistics(numbers: List[float]) -> Optional[Stats]:
     """
     Calculate statistical measures for a list of numbers.
 
     Demonstrates:
     - Guard clause pattern (early return for empty list)
-    - Dictionary construction with multiple key-value pairs
-    - Built-in aggregate functions (max, min, sum, len)
-    - Dictionary as structured return value
+    - NamedTuple as a structured, immutable return value
+    - Single-pass aggregation (see _min_max_sum)
 
     Args:
         numbers: List of numeric values to analyze
 
     Returns:
-        Dictionary containing 'max', 'min', 'avg', and 'sum' keys,
+        Stats NamedTuple with max, min, avg, and sum fields,
         or None if the input list is empty
 
     Example:
         >>> list_statistics([10, 20, 30, 40])
-        {'max': 40, 'min': 10, 'avg': 25.0, 'sum': 100}
+        Stats(max=40, min=10, avg=25.0, sum=100.0)
         >>> list_statistics([])
         None
 
     Best Practice:
-        Returning a dictionary allows the caller to access specific
-        statistics by name (e.g., result['avg']) rather than relying
-        on positional access of a tuple.
+        A NamedTuple gives named access (result.avg) like a dict, but with
+        cheaper attribute loads, less memory, and immutability - a good
+        default for small structured return values.
     """
     # Guard clause: Check if list is empty first
     # Using 'not' on an empty list evaluates to True
     if not numbers:
         return None
 
-    # Return dictionary with computed statistics
-    # Built-in functions make this concise and readable
-    return {
-        "max": max(numbers),      # Largest value
-        "min": min(numbers),      # Smallest value
-        "avg": sum(numbers) / len(numbers),  # Mean (average)
-        "sum": sum(numbers)       # Total of all values
-    }
+    # All three reductions in ONE traversal of the list (see _min_max_sum).
+    # The naive version walked the data once per aggregate.
+    mn, mx, total = _min_max_sum(numbers)
+
+    return Stats(max=mx, min=mn, avg=total / len(numbers), sum=total)
 
 
 # ==========================================
@@ -208,21 +248,24 @@ def process_students() -> None:
         Use .get(key, default) instead of dict[key] when you're not sure
         if the key exists. This prevents KeyError exceptions.
     """
+    # Each print() call formats, takes the IO lock, and may flush - fine
+    # for 3 students, dominant for thousands. Joining each section into one
+    # string and writing it once means one big write instead of N small ones.
+
     # Method 1: Iterate over keys (default behavior)
-    print("\n--- Names ---")
-    for name in students:  # Same as: for name in students.keys()
-        print(name)
+    # "\n".join(students) walks the keys, same as: for name in students
+    sys.stdout.write("\n--- Names ---\n" + "\n".join(students) + "\n")
 
     # Method 2: Iterate over values only
-    print("\n--- Scores ---")
-    for score in students.values():
-        print(score)
+    sys.stdout.write("\n--- Scores ---\n" + "\n".join(map(str, students.values())) + "\n")
 
     # Method 3: Iterate over key-value pairs (most common pattern)
-    print("\n--- Pairs ---")
-    for name, score in students.items():
-        # Tuple unpacking: items() returns (key, value) tuples
-        print(f"{name}: {score}")
+    # Tuple unpacking: items() returns (key, value) tuples
+    sys.stdout.write(
+        "\n--- Pairs ---\n"
+        + "\n".join(f"{name}: {score}" for name, score in students.items())
+        + "\n"
+    )
 
     # Safe dictionary access with .get()
     print("\n--- Safe Check ---")
@@ -247,6 +290,64 @@ inventory: Dict[str, Dict[str, Dict[str, int]]] = {
 }
 
 
+def _compute_inventory_value() -> int:
+    """
+    Full recomputation of the inventory's total value.
+
+    A single generator expression consumed by sum()'s C implementation
+    replaces the two nested for-loops - one traversal, no intermediate list.
+    Only needed at startup (or as a consistency check); day-to-day updates
+    go through set_stock/add_item, which adjust the running total in O(1).
+    """
+    return sum(
+        item['price'] * item['stock']
+        for category in inventory.values()
+        for item in category.values()
+    )
+
+
+# Running total of inventory value, maintained incrementally.
+# Re-summing the whole nested dict on every read is O(categories x items);
+# adjusting the total at each mutation makes reads O(1).
+_inventory_value: int = _compute_inventory_value()
+
+
+def set_stock(category: str, item: str, new_stock: int) -> None:
+    """
+    Update an item's stock level and adjust the running total in O(1).
+
+    Args:
+        category: Category the item lives in (e.g. 'Electronics')
+        item: Item name (e.g. 'Laptop')
+        new_stock: The new stock count
+    """
+    global _inventory_value
+    entry = inventory[category][item]
+    # Only the delta matters: (new - old) * price
+    _inventory_value += (new_stock - entry['stock']) * entry['price']
+    entry['stock'] = new_stock
+
+
+def add_item(category: str, item: str, price: int, stock: int) -> None:
+    """
+    Add a new item to a category and fold its value into the running total.
+
+    Args:
+        category: Category to add the item under (created if missing)
+        item: Item name
+        price: Unit price
+        stock: Initial stock count
+    """
+    global _inventory_value
+    inventory.setdefault(category, {})[item] = {"price": price, "stock": stock}
+    _inventory_value += price * stock
+
+
+def total_inventory_value() -> int:
+    """Return the current total inventory value (O(1) - no traversal)."""
+    return _inventory_value
+
+
 def manage_inventory() -> None:
     """
     Demonstrate operations on nested dictionary structures.
@@ -279,25 +380,69 @@ def manage_inventory() -> None:
     print(f"Laptop Price: {laptop_price}")
 
     # 2. Update nested value (simulating a sale)
-    # The -= operator modifies the value in place
-    inventory['Electronics']['Laptop']['stock'] -= 1
+    # Going through set_stock keeps the running total in sync
+    set_stock('Electronics', 'Laptop', inventory['Electronics']['Laptop']['stock'] - 1)
     # After this operation, Laptop stock becomes 4
 
     # 3. Add new item to existing category
-    # We're adding a new inner dictionary to the Electronics category
-    inventory['Electronics']['Keyboard'] = {"price": 50, "stock": 20}
+    # add_item folds the new item's value into the running total
+    add_item('Electronics', 'Keyboard', price=50, stock=20)
 
-    # 4. Calculate total inventory value across all items
-    total = 0
+    # 4. Read the total inventory value - O(1), no nested traversal.
+    # The incremental total stays consistent because every mutation above
+    # went through the helpers. (_compute_inventory_value() re-derives it
+    # from scratch if you ever need a consistency check.)
+    print(f"Total Inventory Value: ${total_inventory_value()}")
 
-    # Outer loop: iterate through categories (Electronics, Furniture)
-    for category in inventory.values():
-        # Inner loop: iterate through items in each category
-        for item in category.values():
-            # Calculate value: price × quantity
-            total += item['price'] * item['stock']
 
-    print(f"Total Inventory Value: ${total}")
+# ==========================================
+# TASK 4.2b: Inventory as Parallel Arrays (SoA)
+# ==========================================
+class InventoryArrays:
+    """
+    Structure-of-Arrays (SoA) alternative to the nested-dict inventory.
+
+    The nested dict stores each item as its own small dict ("Array of
+    Structures"), so valuing the inventory dereferences two boxed objects
+    per item. Here prices and stocks live in two parallel array('q')
+    buffers (contiguous 64-bit ints), with a name -> index dict for O(1)
+    lookup. Valuation becomes a single pairwise multiply-accumulate over
+    two contiguous buffers - the cache-friendly layout that vectorized
+    libraries (NumPy et al.) exploit.
+
+    Example:
+        >>> inv = InventoryArrays()
+        >>> inv.add_item("Laptop", price=1000, stock=5)
+        >>> inv.add_item("Mouse", price=20, stock=50)
+        >>> inv.total_value()
+        6000
+    """
+
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.prices = array('q')  # signed 64-bit, appended in lockstep
+        self.stocks = array('q')
+        self._name_to_idx: Dict[str, int] = {}
+
+    def add_item(self, name: str, price: int, stock: int) -> None:
+        """Append an item to all three parallel arrays (amortized O(1))."""
+        self._name_to_idx[name] = len(self.names)
+        self.names.append(name)
+        self.prices.append(price)
+        self.stocks.append(stock)
+
+    def set_stock(self, name: str, new_stock: int) -> None:
+        """Point-update one stock slot via the name index (O(1))."""
+        self.stocks[self._name_to_idx[name]] = new_stock
+
+    def total_value(self) -> int:
+        """
+        Sum of price * stock over all items.
+
+        sum(map(mul, ...)) streams both buffers through a C-level
+        multiply-accumulate - no per-item dict lookups.
+        """
+        return sum(map(mul, self.prices, self.stocks))
 
 
 # ==========================================
@@ -324,29 +469,74 @@ def clean_usernames(raw_list: List[str]) -> List[str]:
         >>> clean_usernames(["  Bob  ", "ALICE", "  charlie  "])
         ['bob', 'alice', 'charlie']
 
-    Alternative Implementation (List Comprehension):
-        return [name.strip().lower() for name in raw_list]
-
-    This would be more Pythonic and concise, but the loop version
-    is more explicit for learning purposes.
+    Alternative Implementation (Explicit Loop):
+        cleaned = []
+        for name in raw_list:
+            cleaned.append(name.strip().lower())
+        return cleaned
+
+    The loop version is more explicit for learning purposes, but it pays
+    an attribute lookup and method call for .append on every iteration.
+    A list comprehension compiles to a dedicated LIST_APPEND opcode, so it
+    is both the idiomatic and the faster way to build a list. An equivalent
+    C-level pipeline is list(map(str.lower, map(str.strip, raw_list))),
+    but the comprehension reads better and allows chained methods.
     """
-    # Initialize empty list to accumulate results
-    cleaned = []
-
-    # Iterate through each raw username
-    for name in raw_list:
-        # Chain string methods: first strip whitespace, then lowercase
-        # Method chaining works left-to-right: name.strip() returns a string,
-        # then .lower() is called on that result
-        cleaned_name = name.strip().lower()
-        cleaned.append(cleaned_name)
-
-    return cleaned
+    # List comprehension: builds the result with the LIST_APPEND opcode,
+    # skipping the .append attribute lookup + method call per element.
+    return [name.strip().lower() for name in raw_list]
 
 
 # ==========================================
 # TASK 4.4: Set Operations
 # ==========================================
+# Hobby sets as module-level frozensets: constructed (and hashed) once at
+# import instead of on every call. frozenset also signals immutability.
+WILSON_HOBBIES = frozenset({"coding", "gaming", "reading"})
+FRIEND_HOBBIES = frozenset({"gaming", "hiking", "cooking"})
+
+# Closed hobby domain for the bitmask variant below. With <= 64 hobbies,
+# a whole set fits in one machine integer: bit i set means hobby i present.
+ALL_HOBBIES = ("coding", "gaming", "reading", "hiking", "cooking")
+HOBBY_IDS: Dict[str, int] = {hobby: i for i, hobby in enumerate(ALL_HOBBIES)}
+
+
+def hobbies_to_mask(hobbies: Set[str]) -> int:
+    """
+    Encode a hobby set as an integer bitmask.
+
+    Each hobby maps to one bit (via HOBBY_IDS), so intersection, union,
+    and difference become single bitwise ops: a & b, a | b, a & ~b.
+    Hash-table probing disappears entirely.
+
+    Args:
+        hobbies: Set of hobby names (must all appear in ALL_HOBBIES)
+
+    Returns:
+        Integer with one bit set per hobby
+    """
+    mask = 0
+    for hobby in hobbies:
+        mask |= 1 << HOBBY_IDS[hobby]
+    return mask
+
+
+def mask_to_hobbies(mask: int) -> Set[str]:
+    """
+    Decode an integer bitmask back into a set of hobby names.
+
+    Only needed at the edges (e.g. for printing) - the fast path keeps
+    everything as integers.
+
+    Args:
+        mask: Bitmask produced by hobbies_to_mask
+
+    Returns:
+        Set of hobby names whose bits are set
+    """
+    return {hobby for hobby, i in HOBBY_IDS.items() if mask & (1 << i)}
+
+
 def set_hobbies() -> None:
     """
     Demonstrate mathematical set operations with Python sets.
@@ -379,10 +569,10 @@ def set_hobbies() -> None:
         not key-value pairs. Empty set must be created with set(), not {},
         because {} creates an empty dictionary.
     """
-    # Create two sets of hobbies
-    # Sets automatically eliminate duplicates if any exist
-    wilson = {"coding", "gaming", "reading"}
-    friend = {"gaming", "hiking", "cooking"}
+    # The module-level frozensets are built once at import, so repeated
+    # calls don't reconstruct and re-hash the same literals.
+    wilson = WILSON_HOBBIES
+    friend = FRIEND_HOBBIES
 
     # Intersection: What hobbies do both people share?
     # Result: {'gaming'} - only hobby in both sets
@@ -399,6 +589,15 @@ def set_hobbies() -> None:
     print(f"Wilson Only: {wilson.difference(friend)}")
     # Alternative syntax: wilson - friend
 
+    # --- Bitmask variant (small, closed domains) ---
+    # When the universe of hobbies is small and known up front, each set
+    # can be packed into one integer (bit i set = hobby i present) and the
+    # set algebra collapses to single bitwise instructions.
+    w, f = hobbies_to_mask(wilson), hobbies_to_mask(friend)
+    print(f"Common (bitmask): {mask_to_hobbies(w & f)}")     # intersection
+    print(f"All Unique (bitmask): {mask_to_hobbies(w | f)}") # union
+    print(f"Wilson Only (bitmask): {mask_to_hobbies(w & ~f)}") # difference
+
 
 # Script entry point
 if __name__ == "__main__":
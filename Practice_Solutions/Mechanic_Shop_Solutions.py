@@ -1,7 +1,17 @@
-from flask import Blueprint, request, jsonify
+import json
+
+from flask import Blueprint, request, jsonify, Response, stream_with_context
+
+# orjson (a C JSON encoder, typically 3-10x faster than stdlib json on lists
+# of small dicts) is optional - the list endpoints use it when installed and
+# fall back to jsonify otherwise.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from sqlalchemy import String, ForeignKey, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, selectinload
+from sqlalchemy import String, ForeignKey, select, func, desc, bindparam, Index
 from flask_marshmallow import Marshmallow
 from typing import List
 
@@ -22,11 +32,17 @@ class Customer(Base):
     __tablename__ = 'customers'
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(100))
-    email: Mapped[str] = mapped_column(String(100), unique=True)
+    email: Mapped[str] = mapped_column(String(100))
     phone: Mapped[str] = mapped_column(String(20))
-    
+
     tickets: Mapped[List["Ticket"]] = relationship("Ticket", back_populates="customer")
 
+# Unique functional index on lower(email): the search route compares
+# case-insensitively, and a plain index on the raw column would be useless
+# for a lower(email) = ? predicate (silent sequential scan). This replaces
+# unique=True on the column - keeping both would double-index the field.
+Index('ix_customers_email_lower', func.lower(Customer.email), unique=True)
+
 class Mechanic(Base):
     __tablename__ = 'mechanics'
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -43,8 +59,9 @@ class Ticket(Base):
     
     customer_id: Mapped[int] = mapped_column(ForeignKey('customers.id'))
     customer: Mapped["Customer"] = relationship("Customer", back_populates="tickets")
-    
-    mechanic_id: Mapped[int] = mapped_column(ForeignKey('mechanics.id'))
+
+    # index=True keeps the GROUP BY / JOIN in the analytics route index-backed
+    mechanic_id: Mapped[int] = mapped_column(ForeignKey('mechanics.id'), index=True)
     mechanic: Mapped["Mechanic"] = relationship("Mechanic", back_populates="tickets")
 
 # --- Schemas ---
@@ -74,6 +91,44 @@ tickets_schema = TicketSchema(many=True)
 
 mechanic_shop_bp = Blueprint('mechanic_shop_bp', __name__)
 
+def _json_response(payload, status=200):
+    """
+    Serialize a list-endpoint payload with orjson when available.
+
+    jsonify routes through Flask's provider and the stdlib encoder; for
+    responses that are just lists of small dicts the encoder is the main
+    app-side cost, so the C encoder is worth using opportunistically.
+    """
+    if orjson is not None:
+        return Response(orjson.dumps(payload), status=status,
+                        mimetype='application/json')
+    return jsonify(payload), status
+
+# ---------------------------------------------------------
+# Precompiled statements for the hot routes
+# ---------------------------------------------------------
+# Building a select() per request re-runs SQLAlchemy's Core construction
+# and SQL compilation on every call. Hoisting the statements to module
+# constants with bindparam() placeholders means each request only binds
+# parameters against an already-built (and compilation-cached) statement.
+# Compares on lower(email) so the lookup hits ix_customers_email_lower
+# regardless of how the caller cased the address.
+_CUSTOMER_BY_EMAIL_STMT = select(Customer).where(
+    func.lower(Customer.email) == bindparam('email')
+)
+
+# Selecting individual columns (not the Ticket entity) keeps this a pure
+# Core query: rows come back as plain tuples with no identity-map insertion,
+# relationship proxies, or attribute instrumentation. Read-only listings
+# never need full ORM objects - reserve those for write paths.
+_TICKETS_PAGE_STMT = (
+    select(Ticket.id, Ticket.description, Ticket.status,
+           Ticket.customer_id, Ticket.mechanic_id)
+    .where(Ticket.id > bindparam('after'))
+    .order_by(Ticket.id)
+    .limit(bindparam('lim'))
+)
+
 # ---------------------------------------------------------
 # Task 1.1: Route to search customer by their email
 # ---------------------------------------------------------
@@ -88,10 +143,11 @@ def search_customer_by_email():
     if not email:
         return jsonify({"error": "Email parameter is required"}), 400
 
-    # Using SQLAlchemy 2.0 select syntax
-    # .scalar_one_or_none() returns the object or None, raising error if multiple found (unlikely with unique=True)
-    query = select(Customer).where(Customer.email == email)
-    customer = db.session.execute(query).scalar_one_or_none()
+    # Bind the (lowercased) email against the precompiled statement.
+    # session.scalar() goes straight to the single-scalar path instead of
+    # building a full Result just to pull one value out of it; the unique
+    # functional index already guarantees at most one match.
+    customer = db.session.scalar(_CUSTOMER_BY_EMAIL_STMT, {'email': email.lower()})
 
     if customer:
         return customer_schema.jsonify(customer), 200
@@ -106,20 +162,26 @@ def search_customer_by_email():
 def get_top_mechanic():
     """
     Identifies the mechanic with the highest number of associated tickets.
-    Uses Python-side sorting for logic clarity (as seen in Library API examples).
+    Pushes the counting and ranking into the database with a single
+    GROUP BY query, instead of loading every mechanic and lazy-loading
+    each tickets collection (one SELECT per mechanic - the classic N+1).
     """
-    # 1. Get all mechanics
-    mechanics = db.session.query(Mechanic).all()
+    # 1. One aggregate query: count tickets per mechanic, order by the
+    #    count descending, and keep only the top row.
+    query = (
+        select(Mechanic, func.count(Ticket.id).label('ticket_count'))
+        .join(Ticket, Ticket.mechanic_id == Mechanic.id)
+        .group_by(Mechanic.id)
+        .order_by(desc('ticket_count'))
+        .limit(1)
+    )
+    row = db.session.execute(query).first()
 
-    if not mechanics:
+    if not row:
         return jsonify({"message": "No mechanics found"}), 404
 
-    # 2. Sort based on the length of the 'tickets' relationship
-    # reverse=True means descending order (highest first)
-    mechanics.sort(key=lambda mech: len(mech.tickets), reverse=True)
-
-    top_mechanic = mechanics[0]
-    ticket_count = len(top_mechanic.tickets)
+    # 2. Unpack the (Mechanic, count) row - no ticket rows ever left the DB
+    top_mechanic, ticket_count = row
 
     # 3. Return the result with metadata
     return jsonify({
@@ -129,42 +191,123 @@ def get_top_mechanic():
     }), 200
 
 
+# ---------------------------------------------------------
+# Mechanics list with eager-loaded tickets
+# ---------------------------------------------------------
+# Convention for this module: any route that reads a parent's collection
+# (mechanic.tickets, customer.tickets) must eager-load it explicitly.
+# The ORM default lazy-loads each collection on first access, which turns
+# a list of M parents into M+1 queries (the N+1 problem). selectinload
+# issues ONE extra 'WHERE mechanic_id IN (...)' query for all parents at
+# once - and unlike joinedload it doesn't multiply parent rows by child
+# rows, so it's the right default for 1:N collections. Use joinedload only
+# when fetching a single parent and its children in one round-trip.
+@mechanic_shop_bp.route('/mechanics', methods=['GET'])
+def get_mechanics():
+    """
+    Lists every mechanic with their tickets.
+    Two queries total regardless of mechanic count (see selectinload note).
+    """
+    mechanics = db.session.scalars(
+        select(Mechanic).options(selectinload(Mechanic.tickets))
+    ).all()
+
+    output = []
+    for mechanic in mechanics:
+        output.append({
+            "mechanic": mechanic_schema.dump(mechanic),
+            "tickets": tickets_schema.dump(mechanic.tickets)  # already loaded
+        })
+
+    return _json_response(output)
+
+
 # ---------------------------------------------------------
 # Task 1.3: Turn the get_tickets route into a paginated route
 # ---------------------------------------------------------
 @mechanic_shop_bp.route('/tickets', methods=['GET'])
 def get_tickets_paginated():
     """
-    Returns a paginated list of tickets.
-    Usage: GET /tickets?page=1&per_page=10
+    Returns a paginated list of tickets using keyset (seek) pagination.
+    Usage: GET /tickets?after=0&per_page=10
+    Follow the returned 'next_cursor' to fetch the next page.
+
+    Why keyset instead of page/offset?
+    - OFFSET N makes the database scan and discard N rows before the page,
+      so deep pages get slower and slower.
+    - db.paginate also issues a SELECT COUNT(*) on every call.
+    - 'WHERE id > :after ORDER BY id LIMIT :n' is a primary-key index seek:
+      constant time no matter how deep the caller has paged.
     """
+    # 1. Validate parameters up front and return 400 immediately on bad
+    #    input. Only the two int() conversions are wrapped - the rest of
+    #    the handler runs with no exception frame, and the old broad
+    #    'except Exception: return str(e)' (which leaked internals in the
+    #    response) is gone; real bugs now reach Flask's own 500 handler.
     try:
-        # 1. Get parameters with defaults
-        page = int(request.args.get('page', 1))
+        after = int(request.args.get('after', 0))
         per_page = int(request.args.get('per_page', 10))
-        
-        # 2. Create the base query
-        query = select(Ticket)
-        
-        # 3. Use Flask-SQLAlchemy's paginate method
-        # This returns a Pagination object
-        pagination = db.paginate(query, page=page, per_page=per_page, error_out=False)
-        
-        # 4. Extract the items (list of Ticket objects)
-        tickets = pagination.items
-        
-        # 5. Construct a rich response with metadata
-        return jsonify({
-            "tickets": tickets_schema.dump(tickets),
-            "meta": {
-                "page": pagination.page,
-                "per_page": pagination.per_page,
-                "total_pages": pagination.pages,
-                "total_items": pagination.total
-            }
-        }), 200
-
     except ValueError:
         return jsonify({"error": "Invalid pagination parameters"}), 400
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+
+    # Clamp page size so a caller can't request the whole table at once
+    per_page = min(max(per_page, 1), 100)
+
+    # 2. Seek past the cursor; fetch one extra row to learn whether
+    #    another page exists without a COUNT query. The statement is
+    #    precompiled at module level - only the params change here.
+    #    .mappings() returns dict-like rows straight from the driver:
+    #    no ORM Ticket objects are ever constructed on this read path.
+    rows = db.session.execute(
+        _TICKETS_PAGE_STMT, {'after': after, 'lim': per_page + 1}
+    ).mappings().all()
+
+    # 3. The extra row (if present) only signals "more pages" - drop it
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    next_cursor = rows[-1]['id'] if has_more else None
+
+    # 4. Row mappings jsonify directly - no per-row schema dispatch,
+    #    no ORM hydration; just the five columns the response needs.
+    ticket_dicts = [dict(row) for row in rows]
+
+    # 5. Construct the response with cursor metadata
+    return _json_response({
+        "tickets": ticket_dicts,
+        "meta": {
+            "per_page": per_page,
+            "next_cursor": next_cursor
+        }
+    })
+
+
+# ---------------------------------------------------------
+# Full ticket export (streamed)
+# ---------------------------------------------------------
+@mechanic_shop_bp.route('/tickets/export', methods=['GET'])
+def export_tickets():
+    """
+    Streams every ticket as NDJSON (one JSON object per line).
+
+    Building the full list in memory costs O(N) twice - once for the rows
+    and once for the serialized blob - which is exactly how large exports
+    end up OOM-killing the worker. Streaming holds only ~1000 rows at a
+    time: yield_per batches fetches from the driver, and each row is
+    serialized and yielded as soon as it arrives.
+    """
+    def generate():
+        stmt = (
+            select(Ticket.id, Ticket.description, Ticket.status,
+                   Ticket.customer_id, Ticket.mechanic_id)
+            .order_by(Ticket.id)
+            .execution_options(yield_per=1000, stream_results=True)
+        )
+        for row in db.session.execute(stmt).mappings():
+            yield json.dumps(dict(row)) + "\n"
+
+    # stream_with_context keeps the request context (and DB session) alive
+    # while the client consumes the generator
+    return Response(
+        stream_with_context(generate()),
+        mimetype='application/x-ndjson'
+    )
@@ -80,6 +80,35 @@ class EvilWizard(Character):
         self.hp += 10
         print(f"{self.name} regenerates 10 HP! Now at {self.hp}.")
 
+def simulate_battle(hero_hp, hero_atk, boss_hp, boss_atk, boss_regen=10):
+    """
+    Pure-numeric battle kernel: same rules as battle_sim, no objects/prints.
+
+    The narrated battle_sim below is great for a single demo fight, but each
+    round pays for attribute lookups (self.hp, target.atk) and print calls.
+    When running thousands of fights (e.g. Monte-Carlo balance testing),
+    keep the hot loop on plain local ints like this.
+
+    Returns (hero_won: bool, rounds: int).
+    """
+    round_num = 1
+    while True:
+        boss_hp -= hero_atk
+        if boss_hp <= 0:
+            return True, round_num
+        hero_hp -= boss_atk
+        if round_num % 2 == 0:
+            boss_hp += boss_regen
+        if hero_hp <= 0:
+            return False, round_num
+        round_num += 1
+
+def simulate_many(n=1000):
+    """Run n fights through the kernel and report the hero's win rate."""
+    wins = sum(simulate_battle(100, 15, 150, 20)[0] for _ in range(n))
+    print(f"Hero won {wins}/{n} fights.")
+    return wins
+
 def battle_sim():
     hero = Warrior("Conan")
     boss = EvilWizard()
@@ -5,23 +5,47 @@
 # comments found in bp_auth.py, bp_pets.py, etc.
 # ==========================================
 
+import hashlib
+import hmac
+import os
+from collections import defaultdict
+
 # --- MOCK DATABASE & MODELS ---
 # Simulating the SQLAlchemy models and session for logic demonstration
 class MockSession:
+    # Objects are indexed by type on add(), and Owners additionally by
+    # email - so queries skip the isinstance() scan over everything, and
+    # the login/register email lookup is an O(1) dict hit (the mock
+    # equivalent of a unique index on owners.email).
     def __init__(self):
         self.data = []
-    def add(self, obj): self.data.append(obj)
+        self.by_type = defaultdict(list)
+        self.owners_by_email = {}
+    def add(self, obj):
+        self.data.append(obj)
+        self.by_type[type(obj)].append(obj)
+        if isinstance(obj, Owner): self.owners_by_email[obj.email] = obj
     def commit(self): print(">> Database Committed")
-    def query(self, model): return MockQuery(self.data, model)
+    def query(self, model): return MockQuery(self, model)
     def delete(self, obj):
-        if obj in self.data: self.data.remove(obj)
+        if obj in self.data:
+            self.data.remove(obj)
+            self.by_type[type(obj)].remove(obj)
+            if isinstance(obj, Owner): self.owners_by_email.pop(obj.email, None)
 
 class MockQuery:
-    def __init__(self, data, model):
-        self.data = [d for d in data if isinstance(d, model)]
+    def __init__(self, session, model):
+        self.session = session
+        self.model = model
+        self.data = session.by_type[model]  # per-type index, no full scan
     def filter_by(self, **kwargs):
         key, val = list(kwargs.items())[0]
-        self.data = [d for d in self.data if getattr(d, key) == val]
+        if self.model is Owner and key == 'email':
+            # Fast path: email lookups hit the dict index directly
+            hit = self.session.owners_by_email.get(val)
+            self.data = [hit] if hit else []
+        else:
+            self.data = [d for d in self.data if getattr(d, key) == val]
         return self
     def first(self): return self.data[0] if self.data else None
     def all(self): return self.data
@@ -36,6 +60,22 @@ class Pet:
 
 session = MockSession()
 
+# --- PASSWORD HASHING ---
+# Never store or compare plaintext passwords. We store salt + PBKDF2 hash
+# (both hex) and verify with hmac.compare_digest, which takes the same time
+# whether the guess is close or not (constant-time compare). The heavy
+# lifting runs in hashlib's C implementation of PBKDF2-HMAC-SHA256.
+
+def hash_password(password):
+    salt = os.urandom(16)
+    digest = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, 100_000)
+    return salt.hex() + "$" + digest.hex()
+
+def verify_password(stored, password):
+    salt_hex, digest_hex = stored.split("$", 1)
+    candidate = hashlib.pbkdf2_hmac('sha256', password.encode(), bytes.fromhex(salt_hex), 100_000)
+    return hmac.compare_digest(candidate.hex(), digest_hex)
+
 # --- AUTHENTICATION LOGIC (bp_auth.py) ---
 
 def login():
@@ -46,7 +86,7 @@ def login():
     # check database for owner with the given email
     user = session.query(Owner).filter_by(email=email).first()
     
-    if user and user.password == password:
+    if user and verify_password(user.password, password):
         print(f"Welcome back, {user.name}!")
         return user
     else:
@@ -64,7 +104,7 @@ def register():
         print("Email already registered.")
         return None
         
-    new_owner = Owner(name, email, password)
+    new_owner = Owner(name, email, hash_password(password))
     session.add(new_owner)
     session.commit()
     print("Registration successful!")
@@ -104,7 +144,7 @@ def update_pet(current_user):
 # --- MAIN MOCK LOOP ---
 if __name__ == "__main__":
     # Seed
-    session.add(Owner("Alice", "alice@test.com", "123456"))
+    session.add(Owner("Alice", "alice@test.com", hash_password("123456")))
     
     # Test Flow
     user = login() # Try alice@test.com / 123456
@@ -348,9 +348,12 @@ def task_temp_monitor() -> None:
         Max: 72.5
 
     Best Practice:
-        Using an accumulator (list) to collect data, then processing it after
-        collection is complete, is more flexible than computing statistics
-        incrementally. It allows for more complex analysis later.
+        When you only need aggregate statistics, update them as each value
+        arrives instead of re-walking the collected list afterwards. The
+        naive version called sum() twice plus min() and max() - four full
+        passes over the data; the running aggregates below make the final
+        report O(1). The list is still kept in case later analysis needs
+        the raw readings.
     """
     print("\n--- Task 2.4: Temperature Monitor ---")
 
@@ -358,6 +361,11 @@ def task_temp_monitor() -> None:
     # This is the "accumulator pattern" - start empty, add items over time
     readings = []
 
+    # Running aggregates, updated once per reading as it arrives.
+    total = 0.0
+    mn = float('inf')   # any real reading is smaller
+    mx = float('-inf')  # any real reading is larger
+
     # Loop until user types 'done'
     while True:
         # Get input from user
@@ -370,24 +378,32 @@ def task_temp_monitor() -> None:
 
         # Try to convert input to float (handles both integers and decimals)
         try:
-            readings.append(float(val))  # Add valid reading to list
+            reading = float(val)
         except ValueError:
             # If conversion fails (non-numeric input), show error but continue looping
             print("Invalid number.")
-
-    # Process collected data (only if user entered at least one reading)
+            continue
+
+        readings.append(reading)  # Keep the raw value for later analysis
+        # One pass: fold the new reading into all three aggregates now
+        total += reading
+        if reading < mn:
+            mn = reading
+        if reading > mx:
+            mx = reading
+
+    # Report collected data (only if user entered at least one reading)
+    # All values were computed incrementally - no re-traversal of the list
     if readings:
-        # Built-in functions make statistics easy:
-        # len() counts items, sum() adds them, min()/max() find extremes
         print(f"Count: {len(readings)}")
-        print(f"Total: {sum(readings)}")
+        print(f"Total: {total}")
 
-        # Calculate average - sum divided by count
+        # Calculate average - running total divided by count
         # :.2f formats to 2 decimal places
-        print(f"Avg: {sum(readings)/len(readings):.2f}")
+        print(f"Avg: {total/len(readings):.2f}")
 
-        print(f"Min: {min(readings)}")
-        print(f"Max: {max(readings)}")
+        print(f"Min: {mn}")
+        print(f"Max: {mx}")
     else:
         # Handle case where user entered no valid readings
         print("No readings entered.")
@@ -1,5 +1,36 @@
+import mmap
 import os
 import json
+import re
+import sys
+
+# orjson (C JSON codec, roughly 5x faster than stdlib on both parse and
+# serialize) is optional - the config handler uses it when installed and
+# falls back to stdlib json otherwise. Both paths work on bytes so the
+# file can be opened in binary mode and written in a single call.
+try:
+    import orjson
+    _loads = orjson.loads
+    def _dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+    def _dumps(data):
+        return json.dumps(data, indent=4).encode()
+
+# Matches a whole line containing ERROR (bytes pattern - used on the mmap)
+_ERROR_LINE = re.compile(rb"[^\n]*ERROR[^\n]*")
+
+# Fixed dummy log payload, built once at import time. Writing it with a
+# single f.write() is one buffered write instead of five separate
+# Python-level write calls (each of which crosses into the I/O stack).
+LOG_BODY = (
+    b"INFO: Server started\n"
+    b"WARNING: High memory usage\n"
+    b"ERROR: Database connection failed\n"
+    b"INFO: Health check passed\n"
+    b"ERROR: Timeout waiting for service\n"
+)
 
 # ==========================================
 # TASK 11.1: Log Analyzer (Text Files)
@@ -7,39 +38,58 @@ import json
 def analyze_logs():
     """
     1. Creates a dummy log file.
-    2. Reads it line by line.
+    2. Memory-maps it and scans for 'ERROR' in C.
     3. Counts 'ERROR' occurrences.
     4. Writes a summary report.
     """
     filename = "dummy_server.log"
     report_file = "log_report.txt"
-    
-    # Setup: Create dummy log
-    with open(filename, 'w') as f:
-        f.write("INFO: Server started\n")
-        f.write("WARNING: High memory usage\n")
-        f.write("ERROR: Database connection failed\n")
-        f.write("INFO: Health check passed\n")
-        f.write("ERROR: Timeout waiting for service\n")
-    
+
+    # Setup: Create dummy log. The payload is a single ready-made bytes
+    # blob, so skip the buffered file object entirely and write it on the
+    # raw file descriptor: open + write + close, three syscalls total,
+    # with no IOBase/buffer layer in between.
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, LOG_BODY)
+    finally:
+        os.close(fd)
+
     print(f"--- Created {filename} ---")
 
     # Logic: Analyze
-    error_count = 0
+    # Instead of looping over decoded str lines (one Python iteration, one
+    # UTF-8 decode and one 'in' check per line), map the file into memory
+    # and let mmap.count() scan the raw bytes - that runs in C's optimized
+    # substring search with no per-line Python overhead. Only the matching
+    # lines are ever decoded, for the preview prints.
     try:
-        with open(filename, 'r') as f:
-            for line in f:
-                if "ERROR" in line:
-                    error_count += 1
-                    print(f"Found Error: {line.strip()}")
+        with open(filename, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                # findall gives every matching line in one C-level scan;
+                # joining them and writing once means a single stdout
+                # write instead of one print (and one write syscall after
+                # each flush) per error line.
+                matches = _ERROR_LINE.findall(mm)
+                error_count = len(matches)
+                if matches:
+                    sys.stdout.write(
+                        "".join(f"Found Error: {m.decode()}\n" for m in matches)
+                    )
+            finally:
+                mm.close()
     except FileNotFoundError:
         print("Log file not found.")
         return
 
-    # Output: Write Report
-    with open(report_file, 'w') as f:
-        f.write(f"Log Analysis Report\n")
-        f.write(f"Total Errors Found: {error_count}\n")
+    # Output: Write Report - same raw-fd single write as the setup above
+    report = f"Log Analysis Report\nTotal Errors Found: {error_count}\n".encode()
+    fd = os.open(report_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, report)
+    finally:
+        os.close(fd)
     
     print(f"--- Written {report_file} ---")
     
@@ -61,22 +111,40 @@ def update_config(key, value):
     # Default Config
     data = {"theme": "light", "version": "1.0.0", "debug": False}
     
-    # Read existing if available
-    if os.path.exists(config_file):
-        with open(config_file, 'r') as f:
+    # Read existing if available. EAFP: just try the open and catch
+    # FileNotFoundError rather than os.path.exists() first - the
+    # exists+open pair costs two filesystem syscalls (stat, then openat)
+    # on the common path and leaves a race window where the file can
+    # vanish between the check and the open.
+    try:
+        f = open(config_file, 'rb')
+    except FileNotFoundError:
+        pass  # First run - keep the defaults
+    else:
+        with f:
             try:
-                data = json.load(f)
-            except json.JSONDecodeError:
+                data = _loads(f.read())
+            except ValueError:
                 print("Corrupt JSON, starting fresh.")
     
+    # Short-circuit: if the key already holds this value, the file on disk
+    # is correct and the whole serialize+write path can be skipped. A cheap
+    # comparison filtering out no-op updates is the best kind of
+    # optimization - the fastest write is the one never issued.
+    if data.get(key) == value:
+        print(f"Config unchanged ({key} is already {value!r})")
+        return
+
     # Update
     print(f"Old Config: {data}")
     data[key] = value
     print(f"New Config: {data}")
     
-    # Write
-    with open(config_file, 'w') as f:
-        json.dump(data, f, indent=4)
+    # Write: serialize to one bytes blob first, then a single write().
+    # json.dump with indent= streams many small writes into the file;
+    # dumping to a buffer and writing once avoids that.
+    with open(config_file, 'wb') as f:
+        f.write(_dumps(data))
     
     print(f"--- Saved to {config_file} ---")
 
@@ -9,6 +9,19 @@ These examples showcase fundamental Python concepts that form the foundation
 for more advanced programming patterns.
 """
 
+import operator
+
+# Operator dispatch table for the calculator. A dict lookup resolves the
+# operation in one constant-time hash probe, where the if/elif chain it
+# replaces compared the operator string branch by branch. The operator
+# module provides the arithmetic functions already implemented in C.
+_OPS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "/": operator.truediv,
+    "*": operator.mul,
+}
+
 # --- Practice 1: Variables & Output ---
 def practice_1_variables() -> None:
     """
@@ -162,7 +175,6 @@ def calculator_logic() -> None:
           1. Handle ZeroDivisionError for division
           2. Use try-except blocks for input validation
           3. Return values instead of printing directly (better for testing)
-          4. Consider using a dictionary to map operators to functions
     """
     print("\n--- Calculator ---")
 
@@ -171,18 +183,13 @@ def calculator_logic() -> None:
     op = input("Enter operator (+, -, /, *): ")
     num2 = float(input("Enter second number: "))
 
-    # Use if/elif chain to determine which operation to perform
-    # Each condition is checked in order until one matches
-    if op == "+":
-        print(num1 + num2)
-    elif op == "-":
-        print(num1 - num2)
-    elif op == "/":
-        # Note: This will raise ZeroDivisionError if num2 is 0
+    # Dictionary dispatch (see _OPS above): one hash lookup picks the
+    # operation, with .get() returning None for invalid operators
+    fn = _OPS.get(op)
+    if fn:
+        # Note: division will still raise ZeroDivisionError if num2 is 0
         # Better practice: if num2 == 0: print("Cannot divide by zero")
-        print(num1 / num2)
-    elif op == "*":
-        print(num1 * num2)
+        print(fn(num1, num2))
     else:
         # Fallback for invalid operators
         print("Invalid Operator")
@@ -1,5 +1,18 @@
 import re
 
+# ==========================================
+# PRECOMPILED PATTERNS
+# ==========================================
+# re.search(r"...", text) does cache the compiled pattern internally, but
+# every call still pays the cache hash + lookup and argument parsing.
+# Compiling once at import time and calling .search()/.findall()/.sub()
+# on the pattern object skips all of that - the standard setup for any
+# regex used more than once.
+_WORD = re.compile(r"\w+")
+_PHONE = re.compile(r"\d{3}-\d{4}")
+_NUMS = re.compile(r"\d+")
+_ORDER = re.compile(r"\b\d{5}\b")
+
 # ==========================================
 # ASSIGNMENT 1: Basic Patterns
 # ==========================================
@@ -11,22 +24,22 @@ def regex_assignment_1():
     
     # Task 1: Find the first word
     # \w+ matches one or more word characters
-    first_word = re.search(r"\w+", text_sample)
+    first_word = _WORD.search(text_sample)
     if first_word:
         print(f"First Word: {first_word.group()}")
 
     # Task 2: Find phone number (555-XXXX)
     # \d{3} matches 3 digits, - matches literal dash, \d{4} matches 4 digits
-    phone = re.search(r"\d{3}-\d{4}", text_sample)
+    phone = _PHONE.search(text_sample)
     if phone:
         print(f"Phone Found: {phone.group()}")
 
     # Task 3: Find all numbers
-    all_nums = re.findall(r"\d+", text_sample)
+    all_nums = _NUMS.findall(text_sample)
     print(f"All Numbers: {all_nums}")
 
     # Task 4: Find 5-digit Order ID
-    order_id = re.search(r"\b\d{5}\b", text_sample)
+    order_id = _ORDER.search(text_sample)
     if order_id:
         print(f"Order ID: {order_id.group()}")
 
@@ -43,20 +56,19 @@ Message: Great   service!
 def regex_assignment_2():
     print("\n--- Regex Assignment 2 ---")
     
-    # Task 1: Redact Phone Numbers
-    # Replace pattern with "[REDACTED]"
-    # Pattern: \d{3}-\d{4} (simple US format)
-    redacted = re.sub(r"\d{3}-\d{4}", "[REDACTED]", feedback_data)
-    print("Redacted Data:")
-    print(redacted)
-
-    # Task 2: Clean Extra Spaces
-    # \s+ matches one or more whitespace characters
-    # We replace multiple spaces with a single space, but be careful with newlines
-    # Ideally, we might want to just clean distinct lines
-    cleaned = re.sub(r"[ ]{2,}", " ", redacted) # Replace 2+ spaces with 1
-    print("\nCleaned Spacing:")
-    print(cleaned.strip())
+    # Task 1: Redact Phone Numbers (regex earns its keep here - the
+    # pattern is genuinely structural)
+    redacted = _PHONE.sub("[REDACTED]", feedback_data)
+
+    # Task 2: Clean Extra Spaces - no regex needed. For plain whitespace
+    # normalization, " ".join(s.split()) runs entirely in C and also
+    # trims leading/trailing whitespace per line, which the old
+    # [ ]{2,} -> " " substitution never did. Blank lines are dropped.
+    cleaned = "\n".join(
+        " ".join(ln.split()) for ln in redacted.splitlines() if ln.strip()
+    )
+    print("Redacted + Cleaned:")
+    print(cleaned)
 
 if __name__ == "__main__":
     regex_assignment_1()
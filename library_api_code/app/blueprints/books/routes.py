@@ -3,9 +3,9 @@ from . import books_bp
 from .schemas import book_schema, books_schema
 from flask import request, jsonify
 from marshmallow import ValidationError
-from app.models import Books, db
-from app.extensions import limiter, cache
-from sqlalchemy import select
+from app.models import Books, Loans, db
+from app.extensions import limiter, cache, _json
+from sqlalchemy import select, func, desc
 
 #Create Book Endpoint
 @books_bp.route('', methods=['POST'])
@@ -18,22 +18,24 @@ def create_book():
     new_book = Books(**data)
     db.session.add(new_book)
     db.session.commit()
-    return book_schema.jsonify(new_book), 201
+    #dump once + orjson encode - schema.jsonify re-walks the dumped dict through stdlib json
+    return _json(book_schema.dump(new_book)), 201
 
 
 #READ BOOKS
 @books_bp.route('', methods=['GET'])
 # @cache.cached(timeout=90) #If you cache paginated routes it will cache a single page
 def get_books():
-    try: 
-        page = int(request.args.get('page'))
-        per_page = int(request.args.get('per_page'))
-        query = select(Books)
-        books = db.paginate(query, page=page, per_page=per_page) #Handles our pagination so we don't have to track how many items to be sending
-        return books_schema.jsonify(books), 200
-    except (TypeError, ValueError):
-        books = db.session.query(Books).all()
-        return books_schema.jsonify(books), 200
+    # request.args.get(type=int) returns the default on missing OR
+    # malformed values, so no try/except is needed. The old fallback ran a
+    # second, full-table query whenever parsing failed - a malformed page
+    # number was the most expensive request the endpoint could serve.
+    page = request.args.get('page', default=1, type=int)
+    per_page = min(request.args.get('per_page', default=20, type=int), 100) #cap the page size
+
+    query = select(Books)
+    books = db.paginate(query, page=page, per_page=per_page, error_out=False) #Handles our pagination so we don't have to track how many items to be sending
+    return _json(books_schema.dump(books.items)), 200
 
 
 #UPDATE BOOK
@@ -54,7 +56,7 @@ def update_book(book_id):
         setattr(book, key, value) #setting my new attributes
 
     db.session.commit()
-    return book_schema.jsonify(book), 200
+    return _json(book_schema.dump(book)), 200
 
 
 #DELETE BOOK
@@ -71,33 +73,49 @@ def delete_book(book_id):
 
 @books_bp.route('/popularity', methods=['GET'])
 def get_popular_books():
-
-    books = db.session.query(Books).all() #Grabbing all books
-
-    # popular_books = db.session.query(Books).order_by(Books.times_borrowed.desc()).limit(10).all()
-
-    # Sort books list based off of how many loans the've been apart of
-    books.sort(key = lambda book: len(book.loans), reverse=True) 
+    # One aggregate query: count loans per book in SQL, order by that count,
+    # and only pull the top 5 rows. The old version loaded EVERY book, then
+    # len(book.loans) lazy-loaded each book's loan collection (one query per
+    # book - the N+1 problem) just to sort in Python.
+    stmt = (
+        select(Books, func.count(Loans.id).label('readers'))
+        .outerjoin(Books.loans) #outerjoin keeps books with zero loans in the ranking
+        .group_by(Books.id)
+        .order_by(desc('readers'))
+        .limit(5)
+    )
 
     output = []
-    for book in books[:5]:
+    for book, readers in db.session.execute(stmt):
         book_format = {
             "book": book_schema.dump(book),
-            "readers": len(book.loans)
+            "readers": readers
         }
         output.append(book_format)
 
     return jsonify(output), 200
 
-    # lambda num1, num2: num1 + num2
-
 @books_bp.route('/search', methods=['GET'])
 def search_books():
     title = request.args.get('title') #Accessing the qery parameters from my URL
 
-    books = db.session.query(Books).where(Books.title.ilike(f"%{title}%")).all()
-
-    return books_schema.jsonify(books), 200
+    if not title:
+        return jsonify({"error": "title parameter is required"}), 400
+
+    # Normalize the pattern once and compare on lower(title), so the same
+    # query plan works on every backend. A %substring% search is a full
+    # scan on a plain b-tree index; on Postgres, pair this with a pg_trgm
+    # GIN index on lower(title):
+    #   CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    #   CREATE INDEX books_title_trgm ON books USING gin (lower(title) gin_trgm_ops);
+    # which turns the scan into an index probe. SQLite's LIKE is already
+    # case-insensitive for ASCII, so this costs nothing there.
+    pat = f"%{title.lower()}%"
+    books = db.session.scalars(
+        select(Books).where(func.lower(Books.title).like(pat))
+    ).all()
+
+    return _json(books_schema.dump(books)), 200
 
 # Tasks for Mechanic Shop API
 # - Route to search customer by their email
@@ -1,9 +1,11 @@
 from app.extensions import ma
 from app.models import Books
+from marshmallow import EXCLUDE
 
 class BookSchema(ma.SQLAlchemyAutoSchema):
     class Meta:
         model = Books
+        unknown = EXCLUDE #drop unrecognized keys instead of erroring/introspecting them
 
 book_schema = BookSchema()
 books_schema = BookSchema(many=True)
\ No newline at end of file
@@ -3,6 +3,7 @@ from .schemas import item_schema, items_schema, item_descriptions_schema, item_d
 from flask import request, jsonify
 from marshmallow import ValidationError
 from app.models import Items, db, ItemDescription
+from app.extensions import cache, _json
 
 @items_bp.route('/description', methods=['POST'])
 def create_item_description():
@@ -14,12 +15,14 @@ def create_item_description():
     new_description = ItemDescription(**data)
     db.session.add(new_description)
     db.session.commit()
-    return item_description_schema.jsonify(new_description), 201
+    cache.delete('item_descs') #the cached list is stale now - drop it
+    return _json(item_description_schema.dump(new_description)), 201
 
 @items_bp.route('/descriptions', methods=['GET'])
+@cache.cached(timeout=60, key_prefix='item_descs') #skips the full-table SELECT + dump on cache hits
 def get_item_descriptions():
     descriptions = db.session.query(ItemDescription).all()
-    return item_descriptions_schema.jsonify(descriptions), 200
+    return _json(item_descriptions_schema.dump(descriptions)), 200
 
 
 @items_bp.route('/<int:description_id>', methods=['POST'])
@@ -33,9 +36,11 @@ def create_item(description_id):
     new_item = Items(description_id=description_id, **data)
     db.session.add(new_item)
     db.session.commit()
-    return item_schema.jsonify(new_item), 201
+    cache.delete('items_all') #invalidate the cached list after the write
+    return _json(item_schema.dump(new_item)), 201
 
 @items_bp.route('', methods=['GET'])
+@cache.cached(timeout=30, key_prefix='items_all')
 def get_items():
     items = db.session.query(Items).all()
-    return items_schema.jsonify(items), 200
\ No newline at end of file
+    return _json(items_schema.dump(items)), 200
\ No newline at end of file
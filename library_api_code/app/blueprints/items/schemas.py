@@ -1,14 +1,22 @@
 from app.extensions import ma
 from app.models import Items, ItemDescription
+from marshmallow import EXCLUDE, fields
 
 class ItemSchema(ma.SQLAlchemyAutoSchema):
     class Meta:
         model = Items
         include_fk = True
+        unknown = EXCLUDE
 
 class ItemDescriptionSchema(ma.SQLAlchemyAutoSchema):
+    # Serialize the Numeric column as a fixed-place string ("19.99") -
+    # Decimal objects aren't JSON-encodable and a float round-trip would
+    # reintroduce the precision problem Numeric exists to avoid
+    price = fields.Decimal(as_string=True, places=2)
+
     class Meta:
         model = ItemDescription
+        unknown = EXCLUDE
 
 item_schema = ItemSchema()
 items_schema = ItemSchema(many=True)
@@ -2,9 +2,11 @@ from . import loans_bp
 from .schemas import loan_schema, loans_schema
 from flask import request, jsonify
 from marshmallow import ValidationError
-from app.models import Loans, Books, db
+from app.models import Loans, Books, db, loan_book
 from app.blueprints.books.schemas import books_schema
-from app.extensions import limiter
+from app.extensions import limiter, _json
+from sqlalchemy import select, exists
+from sqlalchemy.orm import selectinload
 
 #CREATE LOAN
 @loans_bp.route('', methods=['POST'])
@@ -17,7 +19,7 @@ def create_loan():
     new_loan = Loans(**data)
     db.session.add(new_loan)
     db.session.commit()
-    return loan_schema.jsonify(new_loan) #use jsonify when the schema is return the whole message
+    return _json(loan_schema.dump(new_loan)) #single dump + orjson encode for the whole message
 
 
 #Add book to loan
@@ -27,7 +29,14 @@ def add_book(loan_id, book_id):
     loan = db.session.get(Loans, loan_id)
     book = db.session.get(Books, book_id)
 
-    if book not in loan.books: #checking to see if a relationship already exist between loan and book
+    #checking to see if a relationship already exists between loan and book
+    #one EXISTS query against the association table, instead of loading the
+    #loan's entire book collection just to run a linear 'in' scan over it
+    already_linked = db.session.scalar(
+        select(exists().where(loan_book.c.loan_id == loan_id, loan_book.c.book_id == book_id))
+    )
+
+    if not already_linked:
         loan.books.append(book) #creating a relationship between loan and book
         db.session.commit()
         return jsonify({
@@ -44,7 +53,12 @@ def remove_book(loan_id, book_id):
     loan = db.session.get(Loans, loan_id)
     book = db.session.get(Books, book_id)
 
-    if book in loan.books: #checking to see if a relationship already exist between loan and book
+    #same EXISTS precheck as add_book - no full collection load for the membership test
+    linked = db.session.scalar(
+        select(exists().where(loan_book.c.loan_id == loan_id, loan_book.c.book_id == book_id))
+    )
+
+    if linked:
         loan.books.remove(book) #removing the relationship between loan and book
         db.session.commit()
         return jsonify({
@@ -58,5 +72,10 @@ def remove_book(loan_id, book_id):
 
 @loans_bp.route('', methods=['GET'])
 def get_loans():
-    loans = db.session.query(Loans).all()
-    return loans_schema.jsonify(loans), 200
\ No newline at end of file
+    #selectinload fetches every loan's books in ONE extra IN(...) query up
+    #front; without it, serializing N loans lazy-loads N book collections
+    #(the N+1 problem)
+    loans = db.session.scalars(
+        select(Loans).options(selectinload(Loans.books))
+    ).all()
+    return _json(loans_schema.dump(loans)), 200
\ No newline at end of file
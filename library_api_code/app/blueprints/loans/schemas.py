@@ -1,10 +1,12 @@
 from app.extensions import ma
 from app.models import Loans
+from marshmallow import EXCLUDE
 
 class LoanSchema(ma.SQLAlchemyAutoSchema):
     class Meta:
         model = Loans
         include_fk = True
+        unknown = EXCLUDE
 
 loan_schema = LoanSchema()
 loans_schema = LoanSchema(many=True)
\ No newline at end of file
@@ -3,6 +3,8 @@ from .schemas import order_schema
 from flask import request, jsonify
 from marshmallow import ValidationError
 from app.models import Orders, db, Items
+from app.extensions import _json
+from sqlalchemy import select, update, exists
 
 #CREATE ORDER
 @orders_bp.route('', methods=['POST'])
@@ -15,7 +17,7 @@ def create_order():
     new_order = Orders(**data)
     db.session.add(new_order)
     db.session.commit()
-    return order_schema.jsonify(new_order), 201
+    return _json(order_schema.dump(new_order)), 201
 
 # Add item to order
 @orders_bp.route('/<int:order_id>/add_item/<int:item_id>', methods=['GET'])
@@ -37,14 +39,20 @@ def add_item(order_id, description_id):
 @orders_bp.route('/checkout/<int:order_id>', methods=['GET'])
 def checkout(order_id):
     order = db.session.get(Orders, order_id)
-    
-    #loop through the items in the order
-    for item in order.items:
-        #check if the item is sold
-        if item.is_sold:
-            return jsonify({"message": "Item is already sold"}), 400
-        # mark as sold
-        item.is_sold = True
-    
+
+    if not order:
+        return jsonify({"message": "Invalid Order ID"}), 400
+
+    #precheck with one EXISTS query - the old loop lazy-loaded every item
+    #in the order just to look at a boolean column
+    any_sold = db.session.scalar(
+        select(exists().where(Items.order_id == order_id, Items.is_sold == True))
+    )
+    if any_sold:
+        return jsonify({"message": "Item is already sold"}), 400
+
+    #one bulk UPDATE flips every item server-side; no Items objects are
+    #loaded into the session at all
+    db.session.execute(update(Items).where(Items.order_id == order_id).values(is_sold=True))
     db.session.commit()
     return jsonify({"message": "Order has been placed"}), 200
\ No newline at end of file
@@ -1,9 +1,11 @@
 from app.extensions import ma
 from app.models import Orders
+from marshmallow import EXCLUDE
 
 class OrderSchema(ma.SQLAlchemyAutoSchema):
     class Meta:
         model = Orders
+        unknown = EXCLUDE
 
 order_schema = OrderSchema()
 orders_schema = OrderSchema(many=True)
\ No newline at end of file
@@ -1,13 +1,25 @@
 # from ...blueprints.user import users_bp
 from app.blueprints.user import users_bp
 from .schemas import user_schema, users_schema, login_schema
-from flask import request, jsonify
+from flask import request, jsonify, Response
 from marshmallow import ValidationError
-from app.models import Users, db
-from app.extensions import limiter
-from werkzeug.security import generate_password_hash,check_password_hash
+import hashlib
+import orjson
+from app.models import Users, Loans, db
+from sqlalchemy.orm import selectinload
+from app.extensions import limiter, cache, _json
+from app.util.passwords import hash_password, check_password
 from app.util.auth import encode_token, token_required
+from sqlalchemy import select, insert, update, delete
 from sqlalchemy.exc import IntegrityError
+from concurrent.futures import ThreadPoolExecutor
+
+# Hash checked on login attempts for emails that don't exist. Without it,
+# 'user and check_password_hash(...)' short-circuits and unknown emails
+# answer measurably faster than wrong passwords - a timing oracle that
+# lets an attacker enumerate which emails are registered. Verifying
+# against this throwaway hash makes both branches do the same work.
+_DUMMY_HASH = hash_password("not-a-real-password")
 
 @users_bp.route('/login', methods=['POST'])
 @limiter.limit("5 per 10 minute")
@@ -22,13 +34,24 @@ def login():
   if 'email' not in data or 'password' not in data:
     return jsonify({"error": "Both 'email' and 'password' fields are required."}), 400
   
-  user = db.session.query(Users).where(Users.email==data['email']).first() #Search my db for a user with the email in the request
+  #Fetch only the four columns auth needs, as a plain tuple row - skips
+  #pulling the rest of the (wide) users row off disk and skips ORM entity
+  #construction entirely, since we never touch this object again
+  row = db.session.execute(
+    select(Users.id, Users.password, Users.role, Users.first_name)
+    .where(Users.email == data['email'])
+  ).first()
+
+  #Always run the hash check - against _DUMMY_HASH when the email is
+  #unknown - so hits and misses take the same time (see note at top)
+  pw_hash = row.password if row else _DUMMY_HASH
+  password_ok = check_password(pw_hash, data['password'])
 
-  if user and check_password_hash(user.password, data['password']):
+  if row and password_ok:
     #Create token for user
-    token = encode_token(user.id, role=user.role)
+    token = encode_token(row.id, role=row.role)
     return jsonify({
-      "message": f"Welcome {user.first_name}",
+      "message": f"Welcome {row.first_name}",
       "token": token,
     }), 200
   else:
@@ -46,7 +69,7 @@ def create_user():
   except ValidationError as e:
     return jsonify(e.messages), 400 #Returning the error as a response so the client can see whats wrong with the status code
   
-  data["password"] = generate_password_hash(data["password"]) #resetting the password key's value, to the hash of the current value
+  data["password"] = hash_password(data["password"]) #resetting the password key's value, to the hash of the current value
 
   # Create a User object from my user data
   # new_user = Users(first_name=data['first_name'],)
@@ -59,14 +82,74 @@ def create_user():
   except IntegrityError:
     db.session.rollback()
     return jsonify({"message": "Email already registered"}), 409
-  #Python -> JSON
-  return user_schema.jsonify(new_user), 201 #Successful creation status code
+  #query_string=True keys can't be enumerated per page, so drop the whole
+  #cache after a write - worst case the next read of each page is a miss
+  cache.clear()
+  #Python -> JSON, dumped once straight into an orjson Response - no
+  #second encode pass through jsonify
+  return _json(user_schema.dump(new_user)), 201 #Successful creation status code
+
+# BULK CREATE USERS
+@users_bp.route('/bulk', methods=['POST'])
+def create_users_bulk():
+  try:
+    data_list = users_schema.load(request.json) #validates a LIST of user objects
+  except ValidationError as e:
+    return jsonify(e.messages), 400
+
+  if not data_list:
+    return jsonify({"error": "Expected a non-empty list of users"}), 400
+
+  #Hash the passwords in a thread pool - argon2's C core releases the
+  #GIL, so the hashes (the expensive part) actually compute in parallel
+  #across cores
+  with ThreadPoolExecutor() as pool:
+    hashes = list(pool.map(hash_password, (d["password"] for d in data_list)))
+  for record, pw_hash in zip(data_list, hashes):
+    record["password"] = pw_hash
+
+  try:
+    #One executemany INSERT + one commit for the whole batch, instead of
+    #an INSERT and a commit (with its fsync) per user
+    db.session.execute(insert(Users), data_list)
+    db.session.commit()
+  except IntegrityError:
+    db.session.rollback()
+    return jsonify({"message": "Email already registered"}), 409
+
+  cache.clear()
+  return jsonify({"message": f"Successfully created {len(data_list)} users"}), 201
 
 # READ USERS ROUTE
 @users_bp.route("", methods=["GET"]) #Endpoint to get user information
+@cache.cached(timeout=60, query_string=True) #one cache entry per (after, per_page) combination
 def read_users():
-  users = db.session.query(Users).all()
-  return users_schema.jsonify(users), 200 #Returns the list of users as JSON and HTTP status 200
+  #Keyset pagination: GET /users?after=<last seen id>&per_page=<n>
+  #The old .all() loaded and serialized the entire table on every request -
+  #O(N) memory and wall time. Seeking on id > after is a primary-key index
+  #scan, so each page costs the same no matter how deep the caller goes.
+  after = request.args.get('after', default=0, type=int)
+  #clamp both ends of the page size: 0 would make the empty page satisfy
+  #len(users) == per_page (IndexError on users[-1] below), and SQLite
+  #treats a negative LIMIT as "no limit" - the full-table dump this
+  #route exists to avoid
+  per_page = min(max(request.args.get('per_page', default=20, type=int), 1), 100)
+
+  #selectinload pulls every page-member's loans (and those loans' books)
+  #in two extra IN(...) queries up front - without it, any access to
+  #user.loans during serialization fires one SELECT per user and then one
+  #per loan (the N+1 problem)
+  users = db.session.scalars(
+    select(Users)
+    .options(selectinload(Users.loans).selectinload(Loans.books))
+    .where(Users.id > after).order_by(Users.id).limit(per_page)
+  ).all()
+
+  #'next' is the cursor to pass back as ?after= for the following page
+  return jsonify({
+    "items": users_schema.dump(users),
+    "next": users[-1].id if len(users) == per_page else None
+  }), 200
 
 # Read Individual User - using a Dynamic Endpoint
 @users_bp.route('/profile', methods=['GET'])
@@ -74,18 +157,49 @@ def read_users():
 @token_required
 def read_user():
   user_id = request.logged_in_user_id
-  user = db.session.get(Users, user_id)
-  return user_schema.jsonify(user), 200
+
+  #The profile only changes when the user updates it, so keep the dumped
+  #body and its ETag cached - a warm hit skips the DB round-trip and the
+  #schema dump, and a matching If-None-Match skips the body entirely
+  cached = cache.get(f'profile:{user_id}')
+  if cached is None:
+    #same eager-load as read_users, so touching user.loans costs no extra queries
+    user = db.session.get(
+      Users, user_id,
+      options=[selectinload(Users.loans).selectinload(Loans.books)]
+    )
+    body = orjson.dumps(user_schema.dump(user))
+    #blake2b: C implementation, and 8 bytes is plenty for a cache validator
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    cache.set(f'profile:{user_id}', (etag, body), timeout=60)
+  else:
+    etag, body = cached
+
+  #request.if_none_match handles the quoting/list parsing of the header
+  if etag in request.if_none_match:
+    return '', 304
+
+  resp = Response(body, mimetype='application/json')
+  resp.set_etag(etag)
+  return resp, 200
 
 # Delete a User
 @users_bp.route("", methods=["DELETE"])
 @token_required
 def delete_user():
   token_id = request.logged_in_user_id
-  user = db.session.get(Users, token_id) #look up whoever the token belongs to (aka whos logged it)
-  
-  db.session.delete(user)
+  #The token already identifies the row, so skip the SELECT + ORM
+  #materialization and issue the DELETE directly - one round-trip instead
+  #of two. The database cascades to the user's loans itself (see the
+  #ON DELETE CASCADE on Loans.user_id) rather than SQLAlchemy walking the
+  #relationship in Python.
+  result = db.session.execute(delete(Users).where(Users.id == token_id))
   db.session.commit()
+
+  if not result.rowcount:
+    return jsonify({"message": "User not found"}), 404
+
+  cache.clear() #cached user listings are stale now
   return jsonify({"message": f"Successfully deleted user {token_id}"}), 200
 
 #UPDATE A USER
@@ -93,26 +207,35 @@ def delete_user():
 # @limiter.limit("1 per month")
 @token_required
 def update_user():
-  #Query the user by id
   user_id = request.logged_in_user_id
-  user = db.session.get(Users, user_id) #Query for our user to update
-  if not user: #Checking if I got a user with that id
-    return jsonify({"message": "User not found"}), 404 
   #Validate and Deserialize the updates that they are sending in the body of the request
   try:
     user_data = user_schema.load(request.json, partial=True)
   except ValidationError as e:
     return jsonify({"message": e.messages}), 400
-  # for each of the values that they are sending, we will change the value of the queried object
-  if "password" in user_data:
-    user_data["password"] = generate_password_hash(user_data["password"]) #resetting the password key's value, to the hash of the current value
 
-  # if user_data['email']:
-  #   user.email = user_data["email"]
+  if not user_data:
+    return jsonify({"message": "No fields to update"}), 400
+
+  #Only hash when the caller actually sent a new password - hashing is the
+  #expensive part of this endpoint, and rehashing a value that didn't
+  #change (or worse, an already-hashed one) would be pure waste
+  if "password" in user_data:
+    user_data["password"] = hash_password(user_data["password"]) #resetting the password key's value, to the hash of the current value
 
-  for key, value in user_data.items():
-    setattr(user, key, value) #setting object, Attribute, value to replace
-  # commit the changes
+  #One UPDATE statement with exactly the changed columns, instead of
+  #SELECTing the row, mutating attributes one setattr at a time and
+  #letting the ORM flush machinery diff it all back out. rowcount doubles
+  #as the existence check, so no preliminary SELECT is needed either.
+  result = db.session.execute(
+    update(Users).where(Users.id == user_id).values(**user_data)
+  )
   db.session.commit()
-  # return a response
-  return user_schema.jsonify(user), 200
\ No newline at end of file
+
+  if not result.rowcount: #no row matched the token's user id
+    return jsonify({"message": "User not found"}), 404
+
+  cache.clear() #cached user listings are stale now
+  # return the updated row
+  user = db.session.get(Users, user_id)
+  return _json(user_schema.dump(user)), 200
\ No newline at end of file
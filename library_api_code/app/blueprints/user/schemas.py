@@ -1,11 +1,14 @@
 # from ...extensions import ma
 from app.extensions import ma
 from app.models import Users
-from marshmallow import Schema, fields
+from marshmallow import Schema, fields, EXCLUDE
 
 class UserSchema(ma.SQLAlchemyAutoSchema):
   class Meta:
     model = Users #Creates a schema that validates the data as defined by our Users Model
+    unknown = EXCLUDE
+    load_instance = False #load() returns plain dicts (the routes build Users(**data) themselves)
+    load_only = ('password',) #accepted on input, but NEVER dumped - the hash was leaking in every user response
 
 class LoginSchema(Schema):
     email = fields.Str(required=True)
@@ -1,3 +1,5 @@
+import orjson
+from flask import Response
 from flask_marshmallow import Marshmallow #Importing Marshmallow class
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
@@ -10,4 +12,14 @@ limiter = Limiter(
     default_limits=["200 per day", "50 per hour"]
 )
 
-cache = Cache()
\ No newline at end of file
+cache = Cache()
+
+def _json(payload):
+    """Build a JSON response from an already-dumped payload with orjson.
+
+    schema.jsonify() dumps the objects to dicts and then walks that result
+    a second time through stdlib json (which also sorts keys). Dumping once
+    with schema.dump() and encoding with orjson's C serializer keeps list
+    endpoints to a single traversal.
+    """
+    return Response(orjson.dumps(payload), mimetype="application/json")
\ No newline at end of file
@@ -24,8 +24,22 @@ Relationship Types Explained:
 
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from sqlalchemy import String, Date, Column, ForeignKey, Table, DateTime, Float
+from sqlalchemy import String, Date, Column, ForeignKey, Table, DateTime, Numeric, Index, UniqueConstraint, event, func
+from sqlalchemy.engine import Engine
 from datetime import date, datetime, timedelta
+from decimal import Decimal
+import sqlite3
+
+
+# SQLite ships with foreign-key enforcement OFF, and every configured
+# environment here is SQLite - without this pragma the ON DELETE CASCADE
+# declared below is silently ignored and deleting a user strands their
+# loans with a dangling user_id. Issued per-connection because the
+# setting is connection-local.
+@event.listens_for(Engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
 
 
 # ============================================
@@ -59,11 +73,16 @@ db = SQLAlchemy(model_class=Base)
 # ============================================
 # ASSOCIATION TABLE FOR MANY-TO-MANY RELATIONSHIP
 # ============================================
+# Foreign keys do NOT get indexes automatically on Postgres - without the
+# index=True below, every loan<->book JOIN (and the EXISTS membership
+# checks in the loans routes) sequential-scans this table. The unique
+# constraint also rules out duplicate loan/book links at the DB level.
 loan_book = Table(
     "loan_book",  # Table name in database
     Base.metadata,  # Links this table to our Base's metadata
-    Column("loan_id", ForeignKey("loans.id")),  # Foreign key to loans table
-    Column("book_id", ForeignKey("books.id"))   # Foreign key to books table
+    Column("loan_id", ForeignKey("loans.id", ondelete="CASCADE"), index=True),  # Foreign key to loans table; rows die with their loan so the users -> loans cascade isn't blocked
+    Column("book_id", ForeignKey("books.id"), index=True),  # Foreign key to books table
+    UniqueConstraint("loan_id", "book_id", name="uq_loan_book"),
 )
 """
 Association table for Many-to-Many relationship between Loans and Books.
@@ -127,7 +146,7 @@ class Users(Base):
     # Mapped[str] means this column is required (NOT NULL)
     first_name: Mapped[str] = mapped_column(String(100))
     last_name: Mapped[str] = mapped_column(String(100))
-    email: Mapped[str] = mapped_column(String(350), unique=True)  # Unique constraint prevents duplicate emails
+    email: Mapped[str] = mapped_column(String(350))  # Uniqueness enforced by ix_users_email_cover below
     phone: Mapped[str] = mapped_column(String(15))
 
     # Password storage - should always be hashed (e.g., with bcrypt or Werkzeug security)
@@ -142,7 +161,21 @@ class Users(Base):
     # back_populates creates bidirectional relationship:
     #   - user.loans gets all loans for this user
     #   - loan.user gets the user who made the loan
-    loans: Mapped[list['Loans']] = relationship('Loans', back_populates='user')
+    # passive_deletes trusts the database's ON DELETE CASCADE (declared on
+    # Loans.user_id) instead of loading the collection to cascade in Python
+    loans: Mapped[list['Loans']] = relationship('Loans', back_populates='user', passive_deletes=True)
+
+
+# Unique covering index for the login hot path. login() looks a user up
+# by email and reads id/password/role/first_name; on Postgres the INCLUDE
+# columns let that query resolve as an index-only scan with no heap fetch.
+# This index replaces unique=True on the email column (keeping both would
+# index the field twice); other dialects ignore postgresql_include and
+# still get the plain unique index.
+Index(
+    'ix_users_email_cover', Users.email, unique=True,
+    postgresql_include=['id', 'password', 'role', 'first_name'],
+)
 
 
 # ============================================
@@ -194,7 +227,13 @@ class Loans(Base):
     # ===== FOREIGN KEY TO USERS TABLE =====
     # This creates the Many-to-One relationship
     # Multiple loans can reference the same user_id
-    user_id: Mapped[int] = mapped_column(ForeignKey('users.id'))
+    # ON DELETE CASCADE lets the database remove a deleted user's loans in
+    # the same statement, so user deletion doesn't need the ORM to load and
+    # walk the relationship (note: SQLite only enforces this with
+    # PRAGMA foreign_keys=ON)
+    # index=True keeps user.loans access an index range scan (FKs aren't
+    # auto-indexed on Postgres)
+    user_id: Mapped[int] = mapped_column(ForeignKey('users.id', ondelete='CASCADE'), index=True)
 
     # ===== RELATIONSHIPS =====
     # Many-to-One: This loan belongs to one user
@@ -284,9 +323,13 @@ class Orders(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
-    # Date field with default value - automatically set to today if not specified
-    # default= accepts a callable (date.today) that runs when the object is created
-    order_date: Mapped[date] = mapped_column(Date, default=date.today())
+    # Date field with default value - automatically set to today if not specified.
+    # The old default=date.today() CALLED the function at class-definition
+    # time, freezing whatever day the process imported this module into
+    # every row. server_default=func.current_date() makes the database
+    # compute it per INSERT - correct, and one fewer bound parameter.
+    # (A Python-side alternative is passing the callable: default=date.today)
+    order_date: Mapped[date] = mapped_column(Date, server_default=func.current_date())
 
     # ===== RELATIONSHIP =====
     # One-to-Many: One order has many items
@@ -338,12 +381,13 @@ class Items(Base):
 
     # ===== FOREIGN KEY TO ITEM DESCRIPTION =====
     # Required relationship - every item must have a description
-    description_id: Mapped[int] = mapped_column(ForeignKey('item_description.id'))
+    description_id: Mapped[int] = mapped_column(ForeignKey('item_description.id'), index=True)
 
     # ===== FOREIGN KEY TO ORDERS =====
     # Optional relationship - items can exist without being in an order (inventory)
     # nullable=True allows this to be NULL in the database
-    order_id: Mapped[int] = mapped_column(ForeignKey('orders.id'), nullable=True)
+    # index=True backs the checkout route's EXISTS check and bulk UPDATE
+    order_id: Mapped[int] = mapped_column(ForeignKey('orders.id'), nullable=True, index=True)
 
     # ===== RELATIONSHIPS =====
     # Many-to-One: Many items share one product description
@@ -368,7 +412,7 @@ class ItemDescription(Base):
     Attributes:
         id: Unique product ID
         name: Product name
-        price: Product price (stored as float for decimal values)
+        price: Product price (fixed-point Decimal, exact for money)
         description: Product description/details
         items: Collection of all Item instances of this product
 
@@ -395,10 +439,11 @@ class ItemDescription(Base):
     # Product metadata
     name: Mapped[str] = mapped_column(String(200))
 
-    # Price stored as float to handle decimal values (e.g., $19.99)
-    # In production, consider using Decimal type for financial data
-    # to avoid floating-point precision issues
-    price: Mapped[float] = mapped_column(Float)
+    # Price stored as fixed-point Numeric(10,2), surfaced as Decimal in
+    # Python. Binary floats can't represent most cents values exactly, so
+    # the old Float column made every SUM/AVG in analytics paths subtly
+    # wrong - Numeric is the correct type for money.
+    price: Mapped[Decimal] = mapped_column(Numeric(10, 2))
 
     description: Mapped[str] = mapped_column(String(500))
 
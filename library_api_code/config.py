@@ -1,18 +1,75 @@
+from sqlalchemy.pool import StaticPool
+
+# Signing secret for JWTs - lives here so each environment can override it
+# instead of being buried in app/util/auth.py. Must be >= 32 bytes, the
+# RFC 7518 minimum for an HS256 key.
+JWT_SECRET = 'super secret secrets for signing'
+
+# Shared engine/pool tuning for the file-backed databases.
+# - pool_size/max_overflow: keep warm connections ready under concurrent
+#   load instead of paying connect latency per request; the overflow head-
+#   room absorbs bursts instead of queueing callers
+# - pool_pre_ping off: pre_ping costs a SELECT 1 round-trip on EVERY
+#   checkout to guard against a rare event. pool_recycle already retires
+#   connections before typical server-side idle timeouts, which covers the
+#   common way connections go stale
+# - compiled_cache: reuse compiled SQL for repeated statements instead of
+#   re-stringifying them each request
+# (TestingConfig uses in-memory SQLite, which has its own pooling - these
+# options don't apply there.)
+ENGINE_OPTIONS = {
+  'pool_size': 20,
+  'max_overflow': 40,
+  'pool_pre_ping': False,
+  'pool_recycle': 1800,
+  'execution_options': {'compiled_cache': {}},
+}
+
 class DevelopmentConfig:
   SQLALCHEMY_DATABASE_URI = 'sqlite:///app.db'
+  JWT_SECRET = JWT_SECRET
   DEBUG = True
   CACHE_TYPE = "SimpleCache"
   CACHE_DEFAULT_TIMEOUT = 300
+  SQLALCHEMY_ENGINE_OPTIONS = ENGINE_OPTIONS
+  # Single-process dev server, so in-memory counters are fine here
+  RATELIMIT_STORAGE_URI = "memory://"
+  RATELIMIT_STRATEGY = "moving-window"
 
 class TestingConfig:
+  # StaticPool hands every checkout the SAME connection, so there is one
+  # in-memory database for the whole process. With the default pool each
+  # new connection gets its own empty :memory: database, which breaks
+  # pooling and makes schema state connection-local. (The usual
+  # test-speed pragmas - journal_mode/synchronous - are no-ops on a
+  # memory database, so they aren't set here.)
   SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+  SQLALCHEMY_ENGINE_OPTIONS = {
+    'poolclass': StaticPool,
+    'connect_args': {'check_same_thread': False},
+  }
+  JWT_SECRET = JWT_SECRET
   TESTING = True
   DEBUG = False
   CACHE_TYPE = "NullCache"
   CACHE_DEFAULT_TIMEOUT = 0
+  RATELIMIT_STORAGE_URI = "memory://"
 
 class ProductionConfig:
   SQLALCHEMY_DATABASE_URI = 'sqlite:///prod.db'
+  JWT_SECRET = JWT_SECRET
   DEBUG = False
-  CACHE_TYPE = "SimpleCache"
+  # SimpleCache is per-process; behind multiple Gunicorn workers each one
+  # would fill (and invalidate) its own private copy. Redis gives every
+  # worker the same cache, so one worker's cache.clear() after a write is
+  # seen by all of them.
+  CACHE_TYPE = "RedisCache"
+  CACHE_REDIS_URL = "redis://localhost:6379/1"
   CACHE_DEFAULT_TIMEOUT = 600
+  SQLALCHEMY_ENGINE_OPTIONS = ENGINE_OPTIONS
+  # Behind multiple Gunicorn workers, in-process memory storage gives each
+  # worker its OWN counters, silently multiplying every limit by the worker
+  # count. Redis makes the counters global, and moving-window closes the
+  # 2x burst that fixed windows allow at window boundaries.
+  RATELIMIT_STORAGE_URI = "redis://localhost:6379/0"
+  RATELIMIT_STRATEGY = "moving-window"
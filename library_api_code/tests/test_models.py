@@ -0,0 +1,8 @@
+from app.models import Base
+
+
+def test_metadata_has_each_table_once(client):
+    # Guards against a second models module drifting in and re-registering
+    # (or shadowing) tables on the shared metadata
+    expected = {'users', 'loans', 'books', 'loan_book', 'orders', 'items', 'item_description'}
+    assert set(Base.metadata.tables) == expected
@@ -1,7 +1,29 @@
-from app.models import Users, db
-from werkzeug.security import check_password_hash, generate_password_hash
+from datetime import date
+
+from app.models import Users, Loans, db
+from app.util.passwords import check_password, hash_password
 from app.util.auth import encode_token
 
+# Hashed once at import - argon2 is deliberately expensive, so re-hashing
+# the same literal inside each test would dominate the suite's runtime
+_HASHED_PW = hash_password("password")
+
+# Each test starts from an empty, rolled-back database, so the first
+# seeded user always gets id 1 - the matching Authorization header can be
+# built once instead of re-signing a token inside every authed test
+_AUTH_HDR_ID1 = {'Authorization': f'Bearer {encode_token(1)}'}
+
+
+def bulk_insert_users(rows):
+    """Seed user rows through a single Core INSERT.
+
+    Fixtures that only need rows to exist don't need the ORM unit of work
+    (identity map, state tracking, one INSERT per instance) - one
+    executemany round-trip covers any number of rows.
+    """
+    db.session.execute(Users.__table__.insert(), rows)
+    db.session.commit()
+
 def test_create_user(client):
     payload = {
         "first_name": "test",
@@ -18,7 +40,24 @@ def test_create_user(client):
     # verify user is in database
     user = db.session.query(Users).filter_by(email="test@user.com").first()
     assert user is not None
-    assert check_password_hash(user.password, "password")
+    assert check_password(user.password, "password")
+
+
+def test_bulk_create(client):
+    payload = [
+        {
+            "first_name": f"test{i}",
+            "last_name": "user",
+            "email": f"test{i}@user.com",
+            "phone": "1234567890",
+            "password": "password"
+        }
+        for i in range(3)
+    ]
+
+    response = client.post('/users/bulk', json=payload)
+    assert response.status_code == 201
+    assert db.session.query(Users).count() == 3
 
 
 def test_invalid_create(client):
@@ -34,19 +73,20 @@ def test_invalid_create(client):
 
 def test_get_users(client):
     # Create a dummy user
-    user = Users(first_name="test", last_name="user", email="test@user.com", phone="123456", password="password")
-    db.session.add(user)
-    db.session.commit()
+    bulk_insert_users([
+        {"first_name": "test", "last_name": "user", "email": "test@user.com", "phone": "123456", "password": "password"}
+    ])
 
     response = client.get('/users')
     assert response.status_code == 200
-    assert len(response.json) == 1
+    assert len(response.json['items']) == 1
+    assert response.json['next'] is None  # only one page of users
 
 
 def test_login(client):
-    user = Users(first_name="test", last_name="user", email="test@user.com", phone="123456", password=generate_password_hash("password"))
-    db.session.add(user)
-    db.session.commit()
+    bulk_insert_users([
+        {"first_name": "test", "last_name": "user", "email": "test@user.com", "phone": "123456", "password": _HASHED_PW}
+    ])
 
     payload = {
         "email": "test@user.com",
@@ -59,16 +99,25 @@ def test_login(client):
 
 
 def test_delete(client):
-    user = Users(first_name="test", last_name="user", email="test@user.com", phone="123456", password="password")
-    db.session.add(user)
-    db.session.commit()
+    bulk_insert_users([
+        {"first_name": "test", "last_name": "user", "email": "test@user.com", "phone": "123456", "password": "password"}
+    ])
 
-    token = encode_token(user.id)
-    headers = {'Authorization': f'Bearer {token}'}
+    # Give the user a loan so the delete exercises the DB-level cascade
+    loan = Loans(borrow_date=date(2024, 1, 1), return_date=date(2024, 1, 15), user_id=1)
+    db.session.add(loan)
+    db.session.commit()
 
-    response = client.delete('/users', headers=headers)
+    response = client.delete('/users', headers=_AUTH_HDR_ID1)
     assert response.status_code == 200
-    assert db.session.get(Users, user.id) is None
+
+    # The route deletes with a bulk DELETE statement, so drop the stale
+    # identity-map entries before checking the rows are really gone
+    db.session.expunge_all()
+    assert db.session.get(Users, 1) is None
+    # ON DELETE CASCADE (enforced via PRAGMA foreign_keys=ON) removed the
+    # loan in the same statement - no orphan row with a dangling user_id
+    assert db.session.query(Loans).count() == 0
 
 
 def test_unauthorized_delete(client):
@@ -77,28 +126,25 @@ def test_unauthorized_delete(client):
 
 
 def test_update(client):
-    user = Users(first_name="test", last_name="user", email="test@user.com", phone="123456", password="password")
-    db.session.add(user)
-    db.session.commit()
-
-    token = encode_token(user.id)
-    headers = {'Authorization': f'Bearer {token}'}
+    bulk_insert_users([
+        {"first_name": "test", "last_name": "user", "email": "test@user.com", "phone": "123456", "password": "password"}
+    ])
 
     payload = {
         "first_name": "Updated"
     }
 
-    response = client.put('/users', json=payload, headers=headers)
+    response = client.put('/users', json=payload, headers=_AUTH_HDR_ID1)
     assert response.status_code == 200
 
-    updated_user = db.session.get(Users, user.id)
+    updated_user = db.session.get(Users, 1)
     assert updated_user.first_name == "Updated"
 
 
 def test_nonunique_email(client):
-    user = Users(first_name="test", last_name="user", email="test@user.com", phone="123456", password="password")
-    db.session.add(user)
-    db.session.commit()
+    bulk_insert_users([
+        {"first_name": "test", "last_name": "user", "email": "test@user.com", "phone": "123456", "password": "password"}
+    ])
 
     payload = {
         "first_name": "test2",